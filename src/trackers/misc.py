@@ -1,50 +1,30 @@
 """Module with miscellaneaous functions and classes, needed for trackers package."""
 
-from threading import Thread, Event
-from typing import Sized
-
-
-class InfSeq:
-    """Class for constructing infinite sequence from sized iterable."""
-    
-    seq: Sized
-    i: int
-
-    def __init__(self, seq: Sized):
-        self.seq = seq
-        self.i = 0
-
-    def __iter__(self):
-        return self
-    
-    def __next__(self):
-        if self.i == len(self.seq):
-            self.i = 0
-        r = self.seq[self.i]
-        self.i += 1
-        return r
-    
-    def __len__(self):
-        return float('inf')
+import os
+import sys
+from threading import Thread
+from typing import Any, Callable, TextIO
 
 
 class StoppableThread(Thread):
     """Thread subclass, that implements functionality to stop thread 
-    (adds event, that should be tracked in order to stop thread execution).
+    (adds flag, that should be tracked in order to stop thread execution).
     """
 
+    _stopped: bool
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.stop_event = Event()
+        self._stopped = False
     
     def stop(self) -> None:
-        """Function to set stop event. After calling, property `is_stopped` will be `True`"""
+        """Function to set stop flag. After calling, property `is_stopped` will be `True`"""
 
-        self.stop_event.set()
+        self._stopped = True
     
     @property
     def is_stopped(self) -> bool:
-        return self.stop_event.is_set()
+        return self._stopped
 
 
 def cls_decorator_w_kwargs(cls, func, **kwargs):
@@ -54,3 +34,29 @@ def cls_decorator_w_kwargs(cls, func, **kwargs):
         def wrapper(func):
             return cls(func, **kwargs)
         return wrapper
+
+
+def get_writer(stream: TextIO) -> tuple[Callable[[str], Any], Callable[[], Any]]:
+    """Function for obtaining `write` and `flush` functions for `stream`. 
+    If `stream` is a terminal (not a Windows console), returned `write` encodes text and writes it 
+    directly to the file descriptor, bypassing Python IO stack (so returned `flush` does nothing).
+    """
+
+    try:
+        fd = stream.fileno()
+        ttyQ = sys.platform != 'win32' and stream.isatty()
+    except (AttributeError, ValueError, OSError):
+        ttyQ = False
+    if not ttyQ:
+        return stream.write, stream.flush
+    encoding = stream.encoding or 'utf-8'
+    errors = stream.errors or 'strict'
+
+    def write(s: str) -> None:
+        # text, already written through `stream`, should be printed first
+        stream.flush()
+        b = s.encode(encoding, errors)
+        while b:
+            b = b[os.write(fd, b):]
+
+    return write, lambda: None
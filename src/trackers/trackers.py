@@ -1,59 +1,123 @@
 """Module with non-threaded trackers."""
 
+import sys
+from itertools import cycle
 from typing import Any, Callable, TypeVar, Iterable, Generic
-from abc import ABCMeta, abstractmethod
-from time import perf_counter
+from time import perf_counter_ns
 from trackers import misc
 
 
 _T = TypeVar('_T')
+_SENTINEL = object()
 
 
-class Tracker(metaclass=ABCMeta):
+class Tracker:
     """Abstract base class for all trackers."""
 
+    __slots__ = ('name', 'call_time_ns', 'now_ns', '_stream', '_write', '_flush')
+
     name: str
-    call_time: float
+    call_time_ns: int
+    now_ns: int
+    _stream: Any
+    _write: Callable[[str], Any]
+    _flush: Callable[[], Any]
 
     def __init__(self, name: str):
         self.name = name
-        self.call_time = perf_counter()
+        self.call_time_ns = self.now_ns = perf_counter_ns()
+        self._stream = None
+    
+    def _bind_stdout(self) -> None:
+        """Private method for (re)binding `_write` and `_flush` to current `sys.stdout`, 
+        so that tracker follows its redirection."""
+
+        if sys.stdout is not self._stream:
+            self._stream = sys.stdout
+            self._write, self._flush = misc.get_writer(self._stream)
     
-    @abstractmethod
     def get_msg(self) -> str:
-        """Method for obtaining message, printed to console."""
-        ...
+        """Method for obtaining message, printed to console. Must be overridden by subclasses."""
+
+        raise NotImplementedError
     
-    @abstractmethod
     def get_end(self) -> str:
-        """Method for obtaining end of message to print (`\\n` or `\\r` usually)."""
-        ...
+        """Method for obtaining end of message to print (`\\n` or `\\r` usually). 
+        Must be overridden by subclasses."""
+
+        raise NotImplementedError
+
+    def get_line(self, *args, **kwargs) -> str:
+        """Method for obtaining full line to print. Combines `get_msg` (called with provided 
+        arguments) and `get_end` methods."""
+
+        return self.get_msg(*args, **kwargs) + self.get_end()
 
     def print(self) -> None:
-        """Method, used for printing to console. Combines `get_msg` and `get_end` methods."""
+        """Method, used for printing to console with a single write of `get_line`. 
+        Updates `now_ns` timestamp, that is used by `get_msg`."""
 
-        print(self.get_msg(), end=self.get_end())
+        self.now_ns = perf_counter_ns()
+        self._bind_stdout()
+        self._write(self.get_line())
     
+    @property
+    def call_time(self) -> float:
+        """Property with tracker call time (in seconds), same as `call_time_ns`."""
+
+        return self.call_time_ns / 1e9
+
+    @call_time.setter
+    def call_time(self, value: float) -> None:
+        self.call_time_ns = int(value * 1e9)
+
     @property
     def dtime(self) -> float:
-        """Property with time delta between tracker `call_time` and current time."""
+        """Property with time delta (in seconds) between tracker `call_time_ns` and current time."""
 
-        return perf_counter() - self.call_time
+        return (perf_counter_ns() - self.call_time_ns) / 1e9
 
 
 class LoopTracker(Tracker):
     """Abstract base class for all non-threaded loop trackers."""
 
+    __slots__ = ('it_i', 'end', 'end_char', 'min_dt_ns', 'last_print_ns')
+
     it_i: int
     end: bool
+    end_char: str
+    min_dt_ns: int
+    last_print_ns: int
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, min_dt: float = 1 / 30):
         super().__init__(name)
         self.it_i = 0
         self.end = False
+        self.end_char = '\r'
+        self.min_dt_ns = int(min_dt * 1e9)
+        self.last_print_ns = -self.min_dt_ns
     
     def get_end(self) -> str:
-        return '\n' if self.end else '\r'
+        return self.end_char
+
+    def print(self) -> None:
+        """Method, used for printing to console. Skips printing if less than `min_dt` seconds 
+        passed since last print, unless loop has ended. Lines ending with `\\r` are flushed 
+        explicitly, so that progress is shown on block-buffered (e.g. redirected) output too."""
+
+        now = perf_counter_ns()
+        if not self.end and now - self.last_print_ns < self.min_dt_ns:
+            return
+        self._paint(now)
+
+    def _paint(self, now: int) -> None:
+        """Private method for printing current line unconditionally, with `now` timestamp."""
+
+        self.last_print_ns = self.now_ns = now
+        self._bind_stdout()
+        self._write(self.get_line())
+        if not self.end:
+            self._flush()
 
 
 class ForTracker(LoopTracker, Generic[_T]):
@@ -78,14 +142,19 @@ class ForTracker(LoopTracker, Generic[_T]):
     for i, val in ForTracker('loop', enumerate(iterable)): ... # Error
     for i, val in ForTracker('loop', iterable, True): ... # Good
     ```
+    Console output is refreshed at most once per `min_dt` seconds (`1/30` by default), 
+    the last line is always printed.
     ## Other \n
     Other details about the functionality and source code may be found on [GitHub](https://github.com/teviroff/python-trackers)
     """
 
+    __slots__ = ('it', 'it_lenQ', 'it_len', 'enumQ', 'msg_tmpl')
+
     it: Iterable[_T]
     it_lenQ: bool
     it_len: int
     enumQ: bool
+    msg_tmpl: str
     
     def _get_len(self):
         """Private method for obtaining `Iterable` length (if possible)."""
@@ -96,48 +165,56 @@ class ForTracker(LoopTracker, Generic[_T]):
         except TypeError:
             self.it_lenQ = False
 
-    def __init__(self, name: str, it: Iterable[_T], enumQ: bool = False):
-        super().__init__(name)
+    def __init__(self, name: str, it: Iterable[_T], enumQ: bool = False, min_dt: float = 1 / 30):
+        super().__init__(name, min_dt)
         self.it = it
         self._get_len()
         self.enumQ = enumQ
+        # enumeration is resolved once here, so that `__next__` does not branch on every iteration
+        if enumQ:
+            self.it = enumerate(it)
+        name = name.replace('%', '%%')
+        if self.it_lenQ:
+            self.msg_tmpl = f'(%d/{self.it_len}) {name} - %.2fs'
+        else:
+            self.msg_tmpl = f'(%d) {name} - %.2fs'
 
     def __iter__(self):
         self.it = iter(self.it)
-        self.call_time = perf_counter()
+        self.call_time_ns = perf_counter_ns()
         self.print()
         return self
     
     def __next__(self) -> _T:
-        try:
-            r_i, r_val = self.it_i, next(self.it)
-        except StopIteration as e:
+        r = next(self.it, _SENTINEL)
+        if r is _SENTINEL:
             self.end = True
+            self.end_char = '\n'
             self.print()
-            raise e
-        self.print()
+            raise StopIteration
+        # inlined throttle check of `print`, so that ticks without repaint make no method calls
+        now = perf_counter_ns()
+        if now - self.last_print_ns >= self.min_dt_ns:
+            self._paint(now)
         self.it_i += 1
-        if self.enumQ:
-            return r_i, r_val
-        return r_val
+        return r
     
     def get_msg(self) -> str:
-        if self.it_lenQ:
-            return f'({self.it_i}/{self.it_len}) {self.name} - {self.dtime:.2f}s'
-        return f'({self.it_i}) {self.name} - {self.dtime:.2f}s'
+        return self.msg_tmpl % (self.it_i, (self.now_ns - self.call_time_ns) / 1e9)
 
 
-class WhileTrackerMeta(ABCMeta):
+class WhileTrackerMeta(type):
     """Metaclass for `WhileTracker`. Defines singleton with slight adjustments."""
 
-    instances: dict[str, Any] = {}
+    instances: dict[tuple[type, str], Any] = {}
 
     def __call__(cls, name: str, expr: bool, *args, **kwargs):
-        h = hash((cls, name))
-        if h not in cls.instances:
-            cls.instances[h] = super().__call__(name, expr, *args, **kwargs)
-        cls.instances[h].expr = expr
-        return cls.instances[h]
+        key = (cls, name)
+        inst = cls.instances.get(key)
+        if inst is None:
+            inst = cls.instances[key] = super().__call__(name, expr, *args, **kwargs)
+        inst.expr = expr
+        return inst
 
 
 class WhileTracker(LoopTracker, metaclass=WhileTrackerMeta):
@@ -156,24 +233,39 @@ class WhileTracker(LoopTracker, metaclass=WhileTrackerMeta):
     # (20) \\ loop - 1.08s, where \\ is progress indicator,
     # that will cycle trough ['-', '/', '|', '\\']
     ```
+    Console output is refreshed at most once per `min_dt` seconds (`1/30` by default), 
+    the last line is always printed.
     ## Other \n
     Other details about the functionality and source code may be found on [GitHub](https://github.com/teviroff/python-trackers)
     """
     
-    prog = misc.InfSeq(['-', '\\', '|', '/'])
+    __slots__ = ('expr', 'msg_tmpl')
 
-    def __init__(self, name: str, expr: bool):
-        super().__init__(name)
+    prog = cycle(('-', '\\', '|', '/'))
+    msg_tmpl: str
+
+    def __init__(self, name: str, expr: bool, min_dt: float = 1 / 30):
+        super().__init__(name, min_dt)
         self.expr = expr
+        self.msg_tmpl = '(%d) %s ' + name.replace('%', '%%') + ' - %.2fs'
     
     def __bool__(self):
-        self.end = not self.expr
+        end = not self.expr
+        if end is not self.end:
+            self.end = end
+            self.end_char = '\n' if end else '\r'
         self.it_i += 1
-        self.print()
+        if end:
+            self.print()
+            return self.expr
+        # inlined throttle check of `print`, so that ticks without repaint make no method calls
+        now = perf_counter_ns()
+        if now - self.last_print_ns >= self.min_dt_ns:
+            self._paint(now)
         return self.expr
     
     def get_msg(self) -> str:
-        return f'({self.it_i}) {next(self.prog)} {self.name} - {self.dtime:.2f}s'
+        return self.msg_tmpl % (self.it_i, next(self.prog), (self.now_ns - self.call_time_ns) / 1e9)
 
 
 class _FuncTracker(Tracker):
@@ -217,27 +309,37 @@ class _FuncTracker(Tracker):
         ...
     # foo | some flag - 0.89s | first_arg=1, second_arg=2
     ```
+    Flags may be switched off with `enabled=False` argument (or by setting `tracker.enabled`), 
+    in this case `tracker.flag` returns immediately without formatting the message.
     ## Other \n
     Other details about functionality and source code may be found on [GitHub](https://github.com/teviroff/python-trackers)
     """
 
+    __slots__ = ('func', 'call_msg', 'exit_msg', 'enabled')
+
     func: Callable
     call_msg: str
     exit_msg: str
+    enabled: bool
 
-    def __init__(self, func, name: str = None, call_msg: str = None, exit_msg: str = None):
+    def __init__(self, func, name: str = None, call_msg: str = None, exit_msg: str = None, 
+                 enabled: bool = True):
         self.func = func
         self.name = func.__name__ if not name else name
         self.call_msg = call_msg
         self.exit_msg = exit_msg
+        self.enabled = enabled
+        self._stream = None
     
     def flag(self, msg: str, timeQ: bool = True, **t_vars):
         """Method for placing additional flags to the function. (see @ `FuncTracker` documentation)"""
 
+        if not self.enabled:
+            return
         self.print(msg, timeQ, **t_vars)
 
     def __call__(self, *args, **kwargs):
-        self.call_time = perf_counter()
+        self.call_time_ns = perf_counter_ns()
         if self.call_msg:
             self.flag(self.call_msg, False)
         r = self.func(self, *args, **kwargs)
@@ -248,7 +350,7 @@ class _FuncTracker(Tracker):
     def get_msg(self, msg: str, timeQ: bool, **t_vars):
         m = f'{self.name} | {msg}'
         if timeQ:
-            m += f' - {self.dtime:.2f}s'
+            m += f' - {(self.now_ns - self.call_time_ns) / 1e9:.2f}s'
         if t_vars:
             _ = ', '.join(f'{var}={repr(val)}' for var, val in t_vars.items())
             m += f' | {_}'
@@ -258,13 +360,16 @@ class _FuncTracker(Tracker):
         return '\n'
     
     def print(self, msg: str, timeQ: bool, **t_vars) -> None:
-        print(self.get_msg(msg, timeQ, **t_vars), end=self.get_end())
+        self.now_ns = perf_counter_ns()
+        self._bind_stdout()
+        self._write(self.get_line(msg, timeQ, **t_vars))
 
 
-def FuncTracker(func=None, *, name: str = None, call_msg: str = None, exit_msg: str = None):
+def FuncTracker(func=None, *, name: str = None, call_msg: str = None, exit_msg: str = None, 
+                enabled: bool = True):
     """Decorator for `_FuncTracker` class."""
 
     return misc.cls_decorator_w_kwargs(
         _FuncTracker, func,
-        name=name, call_msg=call_msg, exit_msg=exit_msg,
+        name=name, call_msg=call_msg, exit_msg=exit_msg, enabled=enabled,
     )